@@ -2,46 +2,43 @@
 Common PipeWire utilities for target detection and validation
 """
 
+import re
 import subprocess
 
 
+# One match per object in `pw-cli list-objects` output, from its
+# "id N, type ..." header line up to the next header or end of output.
+# The output is scanned as bytes; only the captured values are decoded.
+# Patterns are anchored at line starts, so no per-line splitting is needed.
+_OBJ_RE = re.compile(rb'^[ \t]*id \d+, type .*?(?=^[ \t]*id \d+, type |\Z)', re.S | re.M)
+_NAME_RE = re.compile(rb'^[ \t]*node\.name = "([^"]+)"', re.M)
+_DESC_RE = re.compile(rb'^[ \t]*node\.(?:description|nick) = "([^"]+)"', re.M)
+_CLASS_RE = re.compile(rb'^[ \t]*media\.class = "([^"]*(?:Source|source|Input)[^"]*)"', re.M)
+
+
 def get_available_targets():
     """Get list of available PipeWire recording targets"""
     try:
         result = subprocess.run(
             ["pw-cli", "list-objects"],
             capture_output=True,
-            text=True,
             timeout=5
         )
         
         if result.returncode == 0:
-            lines = result.stdout.split('\n')
             sources = []
-            current_obj = {}
-            
-            for line in lines:
-                line = line.strip()
-                
-                if 'id' in line and ('type' in line or 'Node' in line):
-                    if current_obj.get('name') and current_obj.get('is_source'):
-                        sources.append(current_obj)
-                    current_obj = {}
-                elif 'node.name' in line:
-                    parts = line.split('"')
-                    if len(parts) >= 2:
-                        current_obj['name'] = parts[1]
-                elif 'node.description' in line or 'node.nick' in line:
-                    parts = line.split('"')
-                    if len(parts) >= 2:
-                        current_obj['description'] = parts[1]
-                elif 'media.class' in line:
-                    if 'Source' in line or 'source' in line or 'Input' in line:
-                        current_obj['is_source'] = True
             
-            # Don't forget the last object
-            if current_obj.get('name') and current_obj.get('is_source'):
-                sources.append(current_obj)
+            for m in _OBJ_RE.finditer(result.stdout):
+                block = m.group(0)
+                name = _NAME_RE.search(block)
+                media_class = _CLASS_RE.search(block)
+                if name and media_class:
+                    src = {'name': name.group(1).decode('utf-8', 'replace'), 'is_source': True}
+                    # Last description/nick line wins, as pw-cli lists both
+                    descs = _DESC_RE.findall(block)
+                    if descs:
+                        src['description'] = descs[-1].decode('utf-8', 'replace')
+                    sources.append(src)
             
             return sources
         
@@ -5,9 +5,9 @@ Optionally displays VU meter while recording
 """
 
 import threading
-import queue
-import wave
+import struct
 import os
+import re
 import sys
 import time
 import numpy as np
@@ -17,6 +17,44 @@ from vu_meter import VUMeter
 from pipewire_utils import get_available_targets, list_targets, validate_and_select_target
 
 
+# Seconds of audio between page cache drops for the file being recorded
+CACHE_DROP_INTERVAL = 10
+
+# Write buffer for recordings, so several chunks go out in one write syscall
+WRITE_BUFFER_SIZE = 512 * 1024
+
+
+# Canonical 44-byte PCM WAV header: RIFF chunk, fmt chunk, data chunk header
+_WAV_HEADER = struct.Struct('<4sI4s4sIHHIIHH4sI')
+
+
+def _wav_header(channels, rate, sampwidth, data_size=None):
+    """
+    Build a canonical 44-byte PCM WAV header for data_size bytes of audio
+    
+    With data_size None both sizes are 0xFFFFFFFF ("unknown length"), so a
+    file whose recording was interrupted still reads as audio up to its end.
+    """
+    if data_size is None:
+        riff_size = data_size = 0xFFFFFFFF
+    else:
+        data_size = min(data_size, 0xFFFFFFFF - 36)
+        riff_size = 36 + data_size
+    return _WAV_HEADER.pack(
+        b'RIFF', riff_size, b'WAVE',
+        b'fmt ', 16, 1, channels, rate,
+        rate * channels * sampwidth, channels * sampwidth, sampwidth * 8,
+        b'data', data_size
+    )
+
+
+def _drop_cache(f, end=0):
+    """Ask the kernel to drop the first end bytes of file f (0: all of it) from the page cache"""
+    if hasattr(os, 'posix_fadvise'):
+        # Only pages already written back are dropped; dirty ones stay cached
+        os.posix_fadvise(f.fileno(), 0, end, os.POSIX_FADV_DONTNEED)
+
+
 class AudioRecorder:
     """Records audio to WAV files with automatic start/stop based on signal detection"""
     
@@ -53,113 +91,166 @@ class AudioRecorder:
         self.recording = False
         self.current_file = None
         self.wav_file = None
+        self.data_bytes = 0  # PCM bytes written to the current file
+        self.cache_dropped_bytes = 0  # data_bytes at the last page cache drop
+        # Recorded audio is never read back, so don't let it fill the page cache
+        self.cache_drop_bytes = CACHE_DROP_INTERVAL * rate * channels * self.sampwidth
         self.recording_start_time = None
         self.clipping_detected = False  # Track if clipping occurred during current recording
         
-        # Initialize file counter by checking existing files
-        base_no_ext = base_filename
-        if base_no_ext.endswith('.wav'):
-            base_no_ext = base_no_ext[:-4]
+        # Base filename without .wav extension, used to build numbered filenames
+        self._base_no_ext = base_filename[:-4] if base_filename.endswith('.wav') else base_filename
         
-        # Find the highest existing file number (check both normal and clipped)
-        n = 1
-        while os.path.exists(f"{base_no_ext}.{n}.wav") or os.path.exists(f"{base_no_ext}.{n}.clipped.wav"):
-            n += 1
-        self.next_file_number = n
+        # Matches numbered recordings (normal or clipped) in the output directory
+        self._dirname, prefix = os.path.split(self._base_no_ext)
+        self._number_pattern = re.compile(re.escape(prefix) + r'\.(\d+)(?:\.clipped)?\.wav$')
+        # A run that exited without close() can leave its preopened file behind
+        self._sync_next_number(remove_empty=True)
         
-        self.recording_thread = None
-        self.queue = queue.Queue()
-        self.stop_thread = threading.Event()
+        # Audio is written inline from write_audio(); the lock only serializes
+        # start/stop against close() being called from another thread
+        self._lock = threading.Lock()
         
-        # Start the recording thread
-        self.recording_thread = threading.Thread(target=self._recording_worker, daemon=True)
-        self.recording_thread.start()
+        # File for the next recording, opened ahead of time so that starting
+        # a recording does not wait for the filesystem
+        self._next_path = None
+        self._next_file = None
+        self._preopen_next()
+    
+    def _sync_next_number(self, remove_empty=False):
+        """
+        Continue after the highest existing file number, found with a single directory scan
+        
+        Args:
+            remove_empty: Delete numbered files holding no audio (at most a header)
+                instead of counting them
+        """
+        numbers = []
+        try:
+            with os.scandir(self._dirname or '.') as entries:
+                for entry in entries:
+                    m = self._number_pattern.match(entry.name)
+                    if not m:
+                        continue
+                    if remove_empty and entry.stat().st_size <= _WAV_HEADER.size:
+                        os.remove(entry.path)
+                        continue
+                    numbers.append(int(m.group(1)))
+        except FileNotFoundError:
+            pass
+        self.next_file_number = max(numbers, default=0) + 1
     
     def _get_next_filename(self):
         """Find the next available filename with auto-incrementing number"""
-        # Remove .wav extension if present
-        base_no_ext = self.base_filename
-        if base_no_ext.endswith('.wav'):
-            base_no_ext = base_no_ext[:-4]
+        return f"{self._base_no_ext}.{self.next_file_number}.wav"
+    
+    def _open_next(self):
+        """Create the next numbered file and return its path and file object"""
+        # Files may have been added since startup; rescan only on a collision
+        numbered = f"{self._base_no_ext}.{self.next_file_number}"
+        if os.path.exists(f"{numbered}.wav") or os.path.exists(f"{numbered}.clipped.wav"):
+            self._sync_next_number()
+        path = self._get_next_filename()
+        # Write raw PCM after an unknown-length header that is
+        # patched with the final sizes on stop
+        f = open(path, 'wb', buffering=WRITE_BUFFER_SIZE)
+        f.write(_wav_header(self.channels, self.rate, self.sampwidth))
+        return path, f
+    
+    def _preopen_next(self):
+        """Open the file for the next recording while no audio is being written"""
+        try:
+            self._next_path, self._next_file = self._open_next()
+        except Exception as e:
+            # _do_start() opens the file itself if this failed
+            print(f"\nRecording error: {e}", flush=True)
+    
+    def _discard_next(self):
+        """Close and remove the preopened file if it was never used"""
+        if self._next_file is not None:
+            self._next_file.close()
+            os.remove(self._next_path)
+            self._next_path = None
+            self._next_file = None
+    
+    def _do_start(self):
+        """Start recording into the preopened (or a newly opened) file"""
+        if self._next_file is not None:
+            self.current_file, self.wav_file = self._next_path, self._next_file
+            self._next_path = None
+            self._next_file = None
+        else:
+            self.current_file, self.wav_file = self._open_next()
+        self.data_bytes = 0
+        self.cache_dropped_bytes = 0
+        self.recording = True
+        # Monotonic clock: NTP adjustments must not affect the duration check
+        self.recording_start_time = time.monotonic_ns()
+        self.clipping_detected = False  # Reset clipping flag
+        print(f"\nStarted recording to {self.current_file}", flush=True)
+    
+    def _do_write(self, audio_data):
+        """Append one chunk of audio to the current file"""
+        # Write the array's own buffer, no intermediate bytes copy
+        # (PCM is little-endian, as is numpy on supported platforms)
+        view = memoryview(np.ascontiguousarray(audio_data, dtype=self.dtype)).cast('B')
+        self.wav_file.write(view)
+        self.data_bytes += view.nbytes
         
-        # Use current file number
-        filename = f"{base_no_ext}.{self.next_file_number}.wav"
-        return filename
+        if self.data_bytes - self.cache_dropped_bytes >= self.cache_drop_bytes:
+            # Drop only what was written before the previous drop point: the
+            # kernel has normally written that back by now, so the capture
+            # loop never waits for the disk here
+            _drop_cache(self.wav_file, _WAV_HEADER.size + self.cache_dropped_bytes)
+            self.cache_dropped_bytes = self.data_bytes
     
-    def _recording_worker(self):
-        """Worker thread that handles writing audio data to files"""
-        while not self.stop_thread.is_set():
+    def _do_stop(self):
+        """Finalize the current file, then delete or rename it as needed"""
+        self.wav_file.seek(0)
+        self.wav_file.write(_wav_header(self.channels, self.rate, self.sampwidth, self.data_bytes))
+        self.recording = False
+        
+        # Check recording duration
+        duration_ns = time.monotonic_ns() - self.recording_start_time if self.recording_start_time is not None else 0
+        duration = duration_ns / 1e9
+        keep = duration_ns >= self.min_length * 1_000_000_000
+        
+        if keep:
+            # No sync here: this runs in the capture loop. The advice drops the
+            # pages that are already clean and starts writeback of the rest
+            # without waiting for it
+            self.wav_file.flush()
+            _drop_cache(self.wav_file)
+        self.wav_file.close()
+        
+        if not keep:
+            print(f"\nRecording too short ({duration:.1f}s < {self.min_length}s), deleting {self.current_file}", flush=True)
             try:
-                item = self.queue.get(timeout=0.1)
-                
-                if item is None:  # Stop signal
-                    break
-                
-                command, data = item
-                
-                if command == "start":
-                    if not self.recording:
-                        self.current_file = self._get_next_filename()
-                        self.wav_file = wave.open(self.current_file, 'wb')
-                        self.wav_file.setnchannels(self.channels)
-                        self.wav_file.setsampwidth(self.sampwidth)
-                        self.wav_file.setframerate(self.rate)
-                        self.recording = True
-                        self.recording_start_time = time.time()
-                        self.clipping_detected = False  # Reset clipping flag
-                        print(f"\nStarted recording to {self.current_file}", flush=True)
-                
-                elif command == "write":
-                    if self.recording and self.wav_file:
-                        # Write audio data
-                        self.wav_file.writeframes(data.tobytes())
-                
-                elif command == "clipping":
-                    # Mark that clipping was detected
-                    self.clipping_detected = True
-                
-                elif command == "stop":
-                    if self.recording and self.wav_file:
-                        self.wav_file.close()
-                        self.recording = False
-                        
-                        # Check recording duration
-                        duration = time.time() - self.recording_start_time if self.recording_start_time else 0
-                        
-                        if duration < self.min_length:
-                            print(f"\nRecording too short ({duration:.1f}s < {self.min_length}s), deleting {self.current_file}", flush=True)
-                            try:
-                                os.remove(self.current_file)
-                            except Exception as e:
-                                print(f"\nError deleting file: {e}", flush=True)
-                            # Don't increment counter, reuse this number
-                        else:
-                            # Rename file if clipping was detected
-                            final_file = self.current_file
-                            if self.clipping_detected:
-                                # Insert .clipped before .wav extension
-                                clipped_file = self.current_file.replace('.wav', '.clipped.wav')
-                                try:
-                                    os.rename(self.current_file, clipped_file)
-                                    final_file = clipped_file
-                                    print(f"\nStopped recording to {final_file} (duration: {duration:.1f}s) [CLIPPED]", flush=True)
-                                except Exception as e:
-                                    print(f"\nStopped recording to {final_file} (duration: {duration:.1f}s) - Error renaming: {e}", flush=True)
-                            else:
-                                print(f"\nStopped recording to {final_file} (duration: {duration:.1f}s)", flush=True)
-                            # Only increment counter when file is kept
-                            self.next_file_number += 1
-                        
-                        self.current_file = None
-                        self.wav_file = None
-                        self.recording_start_time = None
-                
-                self.queue.task_done()
-                
-            except queue.Empty:
-                continue
+                os.remove(self.current_file)
             except Exception as e:
-                print(f"\nRecording error: {e}", flush=True)
+                print(f"\nError deleting file: {e}", flush=True)
+            # Don't increment counter, reuse this number
+        else:
+            # Rename file if clipping was detected
+            final_file = self.current_file
+            if self.clipping_detected:
+                # Insert .clipped before the .wav extension (current_file always
+                # ends in .wav; replace() would also hit ".wav" inside directory names)
+                clipped_file = self.current_file[:-4] + '.clipped.wav'
+                try:
+                    os.rename(self.current_file, clipped_file)
+                    final_file = clipped_file
+                    print(f"\nStopped recording to {final_file} (duration: {duration:.1f}s) [CLIPPED]", flush=True)
+                except Exception as e:
+                    print(f"\nStopped recording to {final_file} (duration: {duration:.1f}s) - Error renaming: {e}", flush=True)
+            else:
+                print(f"\nStopped recording to {final_file} (duration: {duration:.1f}s)", flush=True)
+            # Only increment counter when file is kept
+            self.next_file_number += 1
+        
+        self.current_file = None
+        self.wav_file = None
+        self.recording_start_time = None
     
     def write_audio(self, audio_data, is_on, has_clipped=False):
         """
@@ -170,28 +261,30 @@ class AudioRecorder:
             is_on: Whether signal is currently on
             has_clipped: Whether clipping was detected in this chunk
         """
-        if is_on:
-            if not self.recording:
-                self.queue.put(("start", None))
-            self.queue.put(("write", audio_data))
-            if has_clipped:
-                self.queue.put(("clipping", None))
-        elif self.recording:
-            self.queue.put(("stop", None))
+        with self._lock:
+            try:
+                if is_on:
+                    if not self.recording:
+                        self._do_start()
+                    self._do_write(audio_data)
+                    if has_clipped:
+                        # Mark that clipping was detected
+                        self.clipping_detected = True
+                elif self.recording:
+                    self._do_stop()
+                    self._preopen_next()
+            except Exception as e:
+                print(f"\nRecording error: {e}", flush=True)
     
     def close(self):
         """Clean up and close the recorder"""
-        if self.recording:
-            self.queue.put(("stop", None))
-        
-        # Wait for queue to empty
-        self.queue.join()
-        
-        # Stop the thread
-        self.stop_thread.set()
-        self.queue.put(None)
-        if self.recording_thread:
-            self.recording_thread.join(timeout=2)
+        with self._lock:
+            try:
+                if self.recording:
+                    self._do_stop()
+                self._discard_next()
+            except Exception as e:
+                print(f"\nRecording error: {e}", flush=True)
 
 
 class RecordingVUMeter(VUMeter):
@@ -200,33 +293,26 @@ class RecordingVUMeter(VUMeter):
     def __init__(self, recorder, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.recorder = recorder
+        # Redraw only every _draw_every-th chunk, so the display stays at
+        # about 5 Hz even when shorter update intervals process audio more often
+        self._draw_every = max(1, round(0.2 / self.update_interval))
+        self._frame_count = 0
     
     def draw_vu_meter(self, stdscr):
         """Override to add recording logic"""
         curses.curs_set(0)
+        stdscr.leaveok(True)
+        # The blocking audio read paces the loop, so key polling never waits
         stdscr.nodelay(1)
-        stdscr.timeout(100)
         
         # Initialize colors
-        curses.start_color()
-        curses.init_pair(1, curses.COLOR_GREEN, curses.COLOR_BLACK)
-        curses.init_pair(2, curses.COLOR_YELLOW, curses.COLOR_BLACK)
-        curses.init_pair(3, curses.COLOR_RED, curses.COLOR_BLACK)
-        curses.init_pair(4, curses.COLOR_WHITE, curses.COLOR_BLACK)
+        self._init_colors()
         
         self.start_recording()
         
-        # Wait a moment for process to start
-        import time
-        time.sleep(0.1)
-        
-        # Check if process started successfully
-        if self.process.poll() is not None:
-            self.stop_recording()
-            stderr = self.process.stderr.read().decode('utf-8', errors='replace')
-            raise RuntimeError(f"pw-record failed to start: {stderr}")
-        
         try:
+            self.wait_for_start()
+            
             while True:
                 # Check for 'q' or ESC key to quit
                 key = stdscr.getch()
@@ -239,32 +325,19 @@ class RecordingVUMeter(VUMeter):
                     break
                 
                 # Process audio and get status
-                db_levels = []
-                peak_db_levels = []
-                max_db_levels = []
-                max_peak_db_levels = []
-                is_on_status = []
-                clip_status = []
-                
-                for ch in range(self.channels):
-                    db = self.calculate_db(audio[:, ch])
-                    peak_db = self.calculate_peak_db(audio[:, ch])
-                    is_clipping = self.detect_clipping(audio[:, ch])
-                    max_db, max_peak_db, is_on, has_clipped = self.update_history(ch, db, peak_db, is_clipping)
-                    db_levels.append(db)
-                    peak_db_levels.append(peak_db)
-                    max_db_levels.append(max_db)
-                    max_peak_db_levels.append(max_peak_db)
-                    is_on_status.append(is_on)
-                    clip_status.append(has_clipped)
+                db_levels, peak_db_levels, clipping = self.calculate_levels(audio)
+                max_db_levels, max_peak_db_levels, is_on_status, clip_status = self.update_history_all(db_levels, peak_db_levels, clipping)
                 
                 # Handle recording - active if ANY channel is on
-                any_channel_on = any(is_on_status)
-                any_clipping = any(clip_status)
+                any_channel_on = bool(is_on_status.any())
+                any_clipping = bool(clip_status.any())
                 self.recorder.write_audio(audio, any_channel_on, any_clipping)
                 
                 # Draw the VU meter
-                self._draw_display(stdscr, db_levels, peak_db_levels, max_db_levels, max_peak_db_levels, is_on_status, clip_status)
+                if self._frame_count % self._draw_every == 0:
+                    self._draw_display(stdscr, db_levels, peak_db_levels, max_db_levels, max_peak_db_levels, is_on_status, clip_status)
+                
+                self._frame_count += 1
                 
         finally:
             self.stop_recording()
@@ -272,9 +345,16 @@ class RecordingVUMeter(VUMeter):
     
     def _draw_display(self, stdscr, db_levels, peak_db_levels, max_db_levels, max_peak_db_levels, is_on_status, clip_status):
         """Draw the VU meter display"""
-        stdscr.clear()
         height, width = stdscr.getmaxyx()
         
+        # Nothing to redraw when no displayed value moved (e.g. silence)
+        if self._frame_unchanged(height, width, self.recorder.recording, db_levels.tobytes(), max_db_levels.tobytes(),
+                                 max_peak_db_levels.tobytes(), is_on_status.tobytes(), clip_status.tobytes()):
+            return
+        
+        # erase() instead of clear(): no forced full repaint, curses sends only changes
+        stdscr.erase()
+        
         # Draw header
         rec_status = " [RECORDING]" if self.recorder.recording else ""
         header = f"VU Meter - {self.target}{rec_status} | Press 'q' or ESC to quit"
@@ -289,19 +369,19 @@ class RecordingVUMeter(VUMeter):
         right_label_width = 30
         bar_width = width - left_label_width - right_label_width - 1
         
+        # Bar cell positions for all channels (RMS, historical max peak, max RMS)
+        bar_lengths = self._bar_positions(db_levels, bar_width)
+        peak_positions = self._bar_positions(max_peak_db_levels, bar_width)
+        max_positions = self._bar_positions(max_db_levels, bar_width)
+        
         for ch, (db, peak_db, max_db, max_peak_db, is_on, has_clipped) in enumerate(zip(db_levels, peak_db_levels, max_db_levels, max_peak_db_levels, is_on_status, clip_status)):
             row = start_row + ch * 2
             if row >= height - 1:
                 break
             
-            normalized = (db - self.min_db) / self.db_range
-            bar_length = int(normalized * bar_width)
-            
-            peak_normalized = (max_peak_db - self.min_db) / self.db_range
-            peak_pos = int(peak_normalized * bar_width)
-            
-            max_normalized = (max_db - self.min_db) / self.db_range
-            max_pos = int(max_normalized * bar_width)
+            bar_length = bar_lengths[ch]
+            peak_pos = peak_positions[ch]
+            max_pos = max_positions[ch]
             
             left_label = f" {db:5.1f}dB "
             if has_clipped:
@@ -312,79 +392,50 @@ class RecordingVUMeter(VUMeter):
             try:
                 stdscr.addstr(row, 0, left_label)
                 
-                for i in range(bar_width):
-                    pos = left_label_width + i
-                    
-                    if i < bar_length:
-                        if not is_on:
-                            color = curses.color_pair(4) | curses.A_DIM
-                        elif db < -20:
-                            color = curses.color_pair(1)
-                        elif db < -10:
-                            color = curses.color_pair(2)
-                        else:
-                            color = curses.color_pair(3)
-                        stdscr.addch(row, pos, '█', color)
-                    # Draw peak indicator (>) at current peak position
-                    elif i == peak_pos and peak_pos >= bar_length:
-                        stdscr.addch(row, pos, '>', curses.color_pair(3) | curses.A_BOLD)
-                    # Draw max RMS indicator
-                    elif i == max_pos and max_pos >= bar_length and max_pos != peak_pos:
-                        stdscr.addch(row, pos, '│', curses.color_pair(2) | curses.A_BOLD)
+                self._draw_bar(stdscr, row, left_label_width, bar_width, bar_length, peak_pos, max_pos, db, is_on)
                 
                 stdscr.addstr(row, left_label_width + bar_width, right_label[:right_label_width])
                 
                 # Draw scale markers
                 if row == start_row:
                     scale_row = row + 1
-                    for db_marker in range(int(self.min_db), int(self.max_db) + 1, 10):
-                        if db_marker < self.min_db or db_marker > self.max_db:
-                            continue
-                        
-                        marker_normalized = (db_marker - self.min_db) / self.db_range
-                        marker_pos = left_label_width + int(marker_normalized * bar_width)
-                        
-                        if marker_pos < left_label_width + bar_width:
-                            try:
-                                stdscr.addstr(scale_row, marker_pos, "│", curses.A_DIM)
-                                label = f"{db_marker:d}dB" if db_marker == 0 else f"{db_marker:d}"
-                                label_pos = marker_pos - len(label) // 2
-                                if label_pos >= 0 and label_pos + len(label) < width:
-                                    stdscr.addstr(scale_row + 1, label_pos, label, curses.A_DIM)
-                            except:
-                                pass
+                    for offset, label in self._scale_markers(bar_width):
+                        marker_pos = left_label_width + offset
+                        try:
+                            stdscr.addstr(scale_row, marker_pos, "│", curses.A_DIM)
+                            label_pos = marker_pos - len(label) // 2
+                            if label_pos >= 0 and label_pos + len(label) < width:
+                                stdscr.addstr(scale_row + 1, label_pos, label, curses.A_DIM)
+                        except:
+                            pass
             except:
                 pass
         
-        stdscr.refresh()
+        stdscr.noutrefresh()
+        curses.doupdate()
 
 
 def run_without_vumeter(recorder, vu_meter):
     """Run recording without VU meter display"""
     import time
     
-    print("Recording started. Press Ctrl+C to stop.")
-    print("Waiting for signal...")
-    
     try:
+        vu_meter.wait_for_start()
+        
+        print("Recording started. Press Ctrl+C to stop.")
+        print("Waiting for signal...")
+        
         while True:
             audio = vu_meter.read_audio_chunk()
             if audio is None:
                 break
             
             # Process audio to determine if signal is on
-            is_on_status = []
-            clip_status = []
-            for ch in range(vu_meter.channels):
-                db = vu_meter.calculate_db(audio[:, ch])
-                peak_db = vu_meter.calculate_peak_db(audio[:, ch])
-                is_clipping = vu_meter.detect_clipping(audio[:, ch])
-                _, _, is_on, has_clipped = vu_meter.update_history(ch, db, peak_db, is_clipping)
-                is_on_status.append(is_on)
-                clip_status.append(has_clipped)
+            db_levels, peak_db_levels, clipping = vu_meter.calculate_levels(audio)
+            _, _, is_on_status, clip_status = vu_meter.update_history_all(db_levels, peak_db_levels, clipping)
             
-            any_channel_on = any(is_on_status)
-            any_clipping = any(clip_status)
+            any_channel_on = bool(is_on_status.any())
+            any_clipping = bool(clip_status.any())
             recorder.write_audio(audio, any_channel_on, any_clipping)
             
     except KeyboardInterrupt:
@@ -454,43 +505,51 @@ def main():
         min_length=args.min_length
     )
     
-    if args.no_vumeter:
-        # Run without VU meter
-        vu_meter = VUMeter(
-            target=args.target,
-            rate=args.rate,
-            channels=args.channels,
-            update_interval=args.interval,
-            db_range=args.db_range,
-            max_db=args.max_db,
-            format=args.format,
-            off_threshold=args.off_threshold,
-            silence_duration=args.silence_duration
-        )
-        vu_meter.start_recording()
-        run_without_vumeter(recorder, vu_meter)
-    else:
-        # Run with VU meter
-        meter = RecordingVUMeter(
-            recorder=recorder,
-            target=args.target,
-            rate=args.rate,
-            channels=args.channels,
-            update_interval=args.interval,
-            db_range=args.db_range,
-            max_db=args.max_db,
-            format=args.format,
-            off_threshold=args.off_threshold,
-            silence_duration=args.silence_duration
-        )
+    # close() removes the preopened file, so it must run however we exit
+    try:
+        if args.no_vumeter:
+            # Run without VU meter
+            vu_meter = VUMeter(
+                target=args.target,
+                rate=args.rate,
+                channels=args.channels,
+                update_interval=args.interval,
+                db_range=args.db_range,
+                max_db=args.max_db,
+                format=args.format,
+                off_threshold=args.off_threshold,
+                silence_duration=args.silence_duration
+            )
+            vu_meter.start_recording()
+            try:
+                run_without_vumeter(recorder, vu_meter)
+            except Exception as e:
+                print(f"Error: {e}", file=sys.stderr)
+                return 1
+        else:
+            # Run with VU meter
+            meter = RecordingVUMeter(
+                recorder=recorder,
+                target=args.target,
+                rate=args.rate,
+                channels=args.channels,
+                update_interval=args.interval,
+                db_range=args.db_range,
+                max_db=args.max_db,
+                format=args.format,
+                off_threshold=args.off_threshold,
+                silence_duration=args.silence_duration
+            )
         
-        try:
-            curses.wrapper(meter.draw_vu_meter)
-        except KeyboardInterrupt:
-            pass
-        except Exception as e:
-            print(f"Error: {e}", file=sys.stderr)
-            return 1
+            try:
+                curses.wrapper(meter.draw_vu_meter)
+            except KeyboardInterrupt:
+                pass
+            except Exception as e:
+                print(f"Error: {e}", file=sys.stderr)
+                return 1
+    finally:
+        recorder.close()
 
 
 if __name__ == "__main__":
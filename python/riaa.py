@@ -10,11 +10,14 @@ import argparse
 
 BASE_URL = "http://localhost:2716/api/v1/module/riaa"
 
+# Shared session so consecutive API calls reuse one keep-alive connection
+_SESSION = requests.Session()
+
 
 def get_riaa_config():
     """Get complete RIAA configuration"""
     try:
-        response = requests.get(f"{BASE_URL}/config", timeout=5)
+        response = _SESSION.get(f"{BASE_URL}/config", timeout=5)
         response.raise_for_status()
         return response.json()
     except requests.exceptions.RequestException as e:
@@ -53,7 +56,7 @@ def print_config(config):
 def set_gain(gain_db):
     """Set RIAA gain"""
     try:
-        response = requests.put(
+        response = _SESSION.put(
             f"{BASE_URL}/gain",
             json={"gain_db": gain_db},
             timeout=5
@@ -74,7 +77,7 @@ def set_gain(gain_db):
 def set_subsonic(filter_value):
     """Set subsonic filter (0=Off, 1=20Hz, 2=30Hz, 3=40Hz)"""
     try:
-        response = requests.put(
+        response = _SESSION.put(
             f"{BASE_URL}/subsonic",
             json={"filter": filter_value},
             timeout=5
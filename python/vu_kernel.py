@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Compiled per-chunk level analysis for the VU meter
+
+Uses Numba when it is installed. Without it channel_stats is None and
+callers fall back to their numpy implementation.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _channel_stats(audio):
+    """
+    Sum of squares and absolute peak of every channel in one pass
+
+    Args:
+        audio: C-contiguous (frames, channels) integer sample array
+
+    Returns:
+        tuple: (sum_squares, peaks) float64 and int64 arrays with one entry per channel
+    """
+    frames, channels = audio.shape
+    sum_squares = np.zeros(channels, np.float64)
+    peaks = np.zeros(channels, np.int64)
+    # Walk the interleaved samples in memory order
+    for i in range(frames):
+        for c in range(channels):
+            v = np.int64(audio[i, c])
+            x = np.float64(v)
+            sum_squares[c] += x * x
+            a = -v if v < 0 else v
+            if a > peaks[c]:
+                peaks[c] = a
+    return sum_squares, peaks
+
+
+channel_stats = njit(cache=True, fastmath=True)(_channel_stats) if njit else None
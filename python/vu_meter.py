@@ -4,12 +4,36 @@ VU Meter for PipeWire audio
 Displays real-time audio levels with dB scale
 """
 
+import fcntl
+import math
+import os
+import select
 import subprocess
 import numpy as np
 import curses
 import sys
-import time
 from pipewire_utils import validate_and_select_target, list_targets
+import vu_kernel
+
+
+# Chunks of audio the pw-record pipe should be able to hold
+PIPE_CHUNKS = 4
+
+# 20 / ln(10): converts a natural log amplitude ratio to dB
+DB_PER_NEPER = 20 / math.log(10)
+
+
+def _make_sum_squares(dtype):
+    """Return a sum-of-squares function specialized for the sample dtype"""
+    # int16 squares (< 2^30) sum exactly in int64; int32 squares reach 2^62,
+    # so a chunk of them could overflow int64 and is summed in float64
+    accumulator = np.int64 if dtype == np.int16 else np.float64
+    
+    def sum_squares(samples):
+        # Sums along the last axis: a scalar for one channel, one value per row of a 2D array
+        return np.einsum('...i,...i->...', samples, samples, dtype=accumulator)
+    
+    return sum_squares
 
 
 class VUMeter:
@@ -36,19 +60,55 @@ class VUMeter:
             self.max_value = 32768.0  # 2^15
         elif format in ["s24", "s24le"]:
             self.bytes_per_sample = 3
-            self.dtype = np.int32  # Will need special handling
+            self.dtype = np.int32  # Packed 3-byte samples are widened on read
             self.max_value = 8388608.0  # 2^23
         else:
             raise ValueError(f"Unsupported format: {format}")
         
+        self._sum_squares = _make_sum_squares(self.dtype)
+        # Bind the level analysis once instead of checking for numba per chunk
+        if vu_kernel.channel_stats is not None:
+            self._analyze = self._analyze_compiled
+            # Compile (or load from the cache) for this sample type now rather
+            # than stalling on the first chunk
+            vu_kernel.channel_stats(np.zeros((1, channels), dtype=self.dtype))
+        else:
+            self._analyze = self._analyze_numpy
+        
+        self._inv_max_value = 1.0 / self.max_value
+        
+        # Samples at or above 99.9% of full scale count as clipping
+        self.clip_threshold = 0.999 * self.max_value
+        # Same threshold as an integer, so samples are compared in their native dtype
+        self._clip_threshold_int = int(np.ceil(self.clip_threshold))
+        # Linear level of the bottom of the display range
+        self.floor_level = self.max_value * 10 ** (self.min_db / 20)
+        
         self.chunk_size = int(rate * channels * self.bytes_per_sample * update_interval)  # bytes per update
+        # Reused for every read; chunks returned by read_audio_chunk are views into it
+        self._raw_buf = bytearray(self.chunk_size)
+        self._raw_view = memoryview(self._raw_buf)
+        # Pick the decoder for the raw chunk once instead of branching per read
+        if self.bytes_per_sample == 3:
+            # Each sample goes into the top 3 bytes of an int32 and is shifted
+            # back down, which sign-extends it
+            self._s24_words = np.zeros((self.chunk_size // 3, 4), dtype=np.uint8)
+            self._decode_chunk = self._decode_s24
+        else:
+            self._decode_chunk = self._decode_native
         self.process = None
         # Keep history based on silence_duration for on/off detection
         self.history_seconds = silence_duration
-        self.history_size = int(self.history_seconds / update_interval)
-        self.db_history = [[] for _ in range(channels)]
-        self.clip_history = [[] for _ in range(channels)]  # Track clipping events
-        self.peak_history = [[] for _ in range(channels)]  # Track absolute peak values
+        self.history_size = max(1, int(self.history_seconds / update_interval))
+        # Ring buffers of the last history_size values per channel. Unused slots
+        # hold -inf so they never win a max or exceed the off threshold.
+        self.db_history = np.full((channels, self.history_size), -np.inf, dtype=np.float32)
+        self.peak_history = np.full((channels, self.history_size), -np.inf, dtype=np.float32)  # Track absolute peak values
+        self.clip_history = np.zeros((channels, self.history_size), dtype=bool)  # Track clipping events
+        self._hist_idx = np.zeros(channels, dtype=np.intp)  # Next slot to write per channel
+        self._channel_idx = np.arange(channels)
+        self._scale_cache = (None, [])  # (bar_width, scale markers)
+        self._last_frame = None  # Display state of the last drawn frame
         
     def start_recording(self):
         """Start the pw-record subprocess"""
@@ -64,6 +124,48 @@ class VUMeter:
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE
         )
+        self._grow_pipe()
+        
+    def wait_for_start(self, timeout=0.5):
+        """
+        Wait until pw-record produces audio, or fails, instead of sleeping a fixed time
+        
+        Raises:
+            RuntimeError: If pw-record exited during startup
+        """
+        ready, _, _ = select.select([self.process.stdout, self.process.stderr], [], [], timeout)
+        if self.process.stderr in ready:
+            # Error output usually means pw-record is about to exit
+            try:
+                self.process.wait(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                pass
+        
+        # Check if process started successfully
+        if self.process.poll() is not None:
+            self.stop_recording()
+            stderr = self.process.stderr.read().decode('utf-8', errors='replace')
+            raise RuntimeError(f"pw-record failed to start: {stderr}")
+        
+    def _grow_pipe(self):
+        """Enlarge the pw-record pipe so a chunk takes fewer read syscalls"""
+        # A pipe read returns at most the pipe capacity (64 KiB by default),
+        # so a 150 KiB chunk needs several reads; a larger pipe also gives
+        # pw-record more headroom while the display is being drawn
+        if not hasattr(fcntl, 'F_SETPIPE_SZ'):
+            return
+        size = PIPE_CHUNKS * self.chunk_size
+        try:
+            # Unprivileged users cannot go above the system-wide limit
+            with open('/proc/sys/fs/pipe-max-size') as f:
+                size = min(size, int(f.read()))
+        except (OSError, ValueError):
+            pass
+        try:
+            fcntl.fcntl(self.process.stdout.fileno(), fcntl.F_SETPIPE_SZ, size)
+        except OSError:
+            # Keep the default pipe size
+            pass
         
     def stop_recording(self):
         """Stop the pw-record subprocess"""
@@ -72,106 +174,258 @@ class VUMeter:
             self.process.wait()
             
     def read_audio_chunk(self):
-        """Read one chunk of audio data"""
+        """
+        Read one chunk of audio data
+        
+        The returned array is a view into a buffer that is overwritten by
+        the next call; copy it if it has to outlive the current iteration.
+        """
         try:
-            raw = self.process.stdout.read(self.chunk_size)
-            if len(raw) < self.chunk_size:
-                return None
-            audio = np.frombuffer(raw, dtype=self.dtype).reshape(-1, self.channels)
-            return audio
+            # Read straight from the pipe into the buffer; going through
+            # process.stdout would copy via BufferedReader's own buffer
+            fd = self.process.stdout.fileno()
+            offset = 0
+            while offset < self.chunk_size:
+                n = os.readv(fd, [self._raw_view[offset:]])
+                if not n:
+                    return None
+                offset += n
+            return self._decode_chunk().reshape(-1, self.channels)
         except Exception as e:
             return None
+    
+    def _decode_native(self):
+        """Samples of a chunk whose format matches the numpy dtype, as a view of the buffer"""
+        return np.frombuffer(self._raw_buf, dtype=self.dtype)
+    
+    def _decode_s24(self):
+        """Samples of a packed little-endian 24-bit chunk, widened to int32"""
+        self._s24_words[:, 1:] = np.frombuffer(self._raw_buf, dtype=np.uint8).reshape(-1, 3)
+        samples = self._s24_words.view('<i4').reshape(-1)
+        samples >>= 8
+        return samples
             
     def calculate_db(self, audio_channel):
         """Calculate dB level for a channel (RMS)"""
-        # Calculate RMS
-        rms = np.sqrt(np.mean(audio_channel.astype(np.float64) ** 2))
+        # Calculate RMS, without materializing a squared copy of the channel
+        rms = math.sqrt(float(self._sum_squares(audio_channel)) / len(audio_channel))
         
         # Avoid log(0)
         if rms < 1:
             return self.min_db
             
         # Convert to dB (relative to max value for the format)
-        db = 20 * np.log10(rms / self.max_value)
+        # (math.log on the scalar avoids numpy's ufunc dispatch overhead)
+        db = DB_PER_NEPER * math.log(rms * self._inv_max_value)
         
         # Clamp to reasonable range
         return max(self.min_db, min(self.max_db, db))
     
     def calculate_peak_db(self, audio_channel):
         """Calculate peak dB level for a channel (absolute max)"""
-        # Get absolute maximum value
-        peak = np.max(np.abs(audio_channel))
+        # Absolute maximum as max(max(x), -min(x)): no abs temporary, and Python
+        # ints cannot overflow on the most negative sample
+        peak = max(int(audio_channel.max()), -int(audio_channel.min()))
         
         # Avoid log(0)
         if peak < 1:
             return self.min_db
             
         # Convert to dB (relative to max value for the format)
-        db = 20 * np.log10(peak / self.max_value)
+        db = DB_PER_NEPER * math.log(peak * self._inv_max_value)
         
         # Clamp to reasonable range
         return max(self.min_db, min(self.max_db, db))
     
     def detect_clipping(self, audio_channel):
         """Detect if any samples exceed 99.9% of full scale"""
-        clip_threshold = 0.999 * self.max_value
-        return np.any(np.abs(audio_channel) >= clip_threshold)
+        return bool(audio_channel.max() >= self._clip_threshold_int or
+                    audio_channel.min() <= -self._clip_threshold_int)
+    
+    def _levels_to_db(self, levels):
+        """Convert per-channel linear levels to dB, clamped to the display range"""
+        db = DB_PER_NEPER * np.log(np.maximum(levels, 1) * self._inv_max_value)
+        # Levels below 1 are treated as silence, as in calculate_db
+        db = np.where(levels < 1, self.min_db, db)
+        return np.clip(db, self.min_db, self.max_db)
+    
+    def calculate_levels(self, audio):
+        """
+        Calculate RMS dB, peak dB and clipping for all channels at once
+        
+        Uses the compiled single-pass kernel from vu_kernel when Numba is
+        available. Otherwise the chunk is deinterleaved once and every
+        statistic is a unit-stride reduction over a contiguous channel row.
+        The implementation is chosen once in __init__.
+        
+        Returns:
+            tuple: (db_levels, peak_db_levels, clipping) arrays with one entry per channel
+        """
+        return self._analyze(np.ascontiguousarray(audio))
+    
+    def _analyze_compiled(self, audio):
+        """calculate_levels using the fused vu_kernel pass"""
+        sum_squares, peaks = vu_kernel.channel_stats(audio)
+        clipping = peaks >= self._clip_threshold_int
+        if self._is_silent(peaks):
+            return self._silent_levels(clipping)
+        return self._levels_from_stats(sum_squares, peaks, audio.shape[0]) + (clipping,)
+    
+    def _analyze_numpy(self, audio):
+        """calculate_levels using numpy reductions over deinterleaved channel rows"""
+        planar = self._deinterleave(audio)
+        # max(|x|) as max(max(x), -min(x)): no abs temporary, and widening
+        # to int64 keeps the most negative sample from overflowing
+        peaks = np.maximum(planar.max(axis=1), -planar.min(axis=1).astype(np.int64))
+        clipping = peaks >= self._clip_threshold_int
+        if self._is_silent(peaks):
+            return self._silent_levels(clipping)
+        return self._levels_from_stats(self._sum_squares(planar), peaks, audio.shape[0]) + (clipping,)
+    
+    def _deinterleave(self, audio):
+        """Return one contiguous row of samples per channel"""
+        if self.channels == 1:
+            return audio.reshape(1, -1)
+        # Reductions down the columns of interleaved samples are slow, so
+        # copy to one contiguous row per channel first
+        return audio.T.copy()
+    
+    def _is_silent(self, peaks):
+        """True if every channel's peak is below the display floor"""
+        # RMS never exceeds the peak, so both levels then clamp to min_db
+        # and the float math can be skipped
+        return not (peaks >= self.floor_level).any()
+    
+    def _silent_levels(self, clipping):
+        """calculate_levels result for a chunk below the display floor"""
+        silent = np.full(self.channels, float(self.min_db))
+        return silent, silent.copy(), clipping
+    
+    def _levels_from_stats(self, sum_squares, peaks, frames):
+        """Convert per-channel sums of squares and peaks to (db_levels, peak_db_levels)"""
+        rms = np.sqrt(sum_squares / frames)
+        return self._levels_to_db(rms), self._levels_to_db(peaks)
     
     def update_history(self, channel, db_value, peak_db_value, is_clipping):
         """Update history for a channel and return max RMS, max peak, on/off status, and clipping status"""
-        self.db_history[channel].append(db_value)
-        self.peak_history[channel].append(peak_db_value)
-        self.clip_history[channel].append(is_clipping)
-        
-        # Keep only last N values (silence_duration worth)
-        if len(self.db_history[channel]) > self.history_size:
-            self.db_history[channel].pop(0)
-        if len(self.peak_history[channel]) > self.history_size:
-            self.peak_history[channel].pop(0)
-        if len(self.clip_history[channel]) > self.history_size:
-            self.clip_history[channel].pop(0)
+        # Overwrite the oldest value (only the last silence_duration worth is kept)
+        idx = self._hist_idx[channel]
+        self.db_history[channel, idx] = db_value
+        self.peak_history[channel, idx] = peak_db_value
+        self.clip_history[channel, idx] = is_clipping
+        self._hist_idx[channel] = (idx + 1) % self.history_size
         
-        max_db = max(self.db_history[channel]) if self.db_history[channel] else self.min_db
-        max_peak_db = max(self.peak_history[channel]) if self.peak_history[channel] else self.min_db
+        max_db = float(self.db_history[channel].max())
+        max_peak_db = float(self.peak_history[channel].max())
         # Source is "on" if any value in history exceeded threshold
-        is_on = any(db > self.off_threshold for db in self.db_history[channel])
+        is_on = bool((self.db_history[channel] > self.off_threshold).any())
         # Clipping detected if any clip in history
-        has_clipped = any(self.clip_history[channel])
+        has_clipped = bool(self.clip_history[channel].any())
         
         return max_db, max_peak_db, is_on, has_clipped
     
+    def update_history_all(self, db_levels, peak_db_levels, clipping):
+        """
+        Update history for all channels at once
+        
+        Returns:
+            tuple: (max_db_levels, max_peak_db_levels, is_on, has_clipped) arrays with one entry per channel
+        """
+        idx = self._hist_idx
+        self.db_history[self._channel_idx, idx] = db_levels
+        self.peak_history[self._channel_idx, idx] = peak_db_levels
+        self.clip_history[self._channel_idx, idx] = clipping
+        self._hist_idx = (idx + 1) % self.history_size
+        
+        max_db_levels = self.db_history.max(axis=1)
+        max_peak_db_levels = self.peak_history.max(axis=1)
+        is_on = (self.db_history > self.off_threshold).any(axis=1)
+        has_clipped = self.clip_history.any(axis=1)
+        return max_db_levels, max_peak_db_levels, is_on, has_clipped
+    
     def is_any_channel_on(self):
         """Check if any channel is currently on"""
-        for ch_history in self.db_history:
-            if any(db > self.off_threshold for db in ch_history):
-                return True
-        return False
-        
-    def draw_vu_meter(self, stdscr):
-        """Main curses loop to draw the VU meter"""
-        curses.curs_set(0)  # Hide cursor
-        stdscr.nodelay(1)    # Non-blocking input
-        stdscr.timeout(100)  # 100ms timeout for getch()
+        return bool((self.db_history > self.off_threshold).any())
         
-        # Initialize colors
+    def _init_colors(self):
+        """Initialize color pairs and cache the attributes used to draw bars"""
         curses.start_color()
         curses.init_pair(1, curses.COLOR_GREEN, curses.COLOR_BLACK)
         curses.init_pair(2, curses.COLOR_YELLOW, curses.COLOR_BLACK)
         curses.init_pair(3, curses.COLOR_RED, curses.COLOR_BLACK)
         curses.init_pair(4, curses.COLOR_WHITE, curses.COLOR_BLACK)  # Gray for off state
         
-        self.start_recording()
+        self._attr_off = curses.color_pair(4) | curses.A_DIM  # Gray
+        self._attr_green = curses.color_pair(1)
+        self._attr_yellow = curses.color_pair(2)
+        self._attr_red = curses.color_pair(3)
+        self._attr_peak = curses.color_pair(3) | curses.A_BOLD
+        self._attr_max = curses.color_pair(2) | curses.A_BOLD
+    
+    def _bar_positions(self, levels, bar_width):
+        """Map per-channel dB levels to cell positions on a bar of bar_width cells"""
+        return ((np.asarray(levels) - self.min_db) / self.db_range * bar_width).astype(int).tolist()
+    
+    def _scale_markers(self, bar_width):
+        """Return (offset, label) for each 10dB scale marker, cached per bar width"""
+        if self._scale_cache[0] != bar_width:
+            markers = []
+            for db_marker in range(int(self.min_db), int(self.max_db) + 1, 10):
+                if db_marker < self.min_db or db_marker > self.max_db:
+                    continue
+                offset = int((db_marker - self.min_db) / self.db_range * bar_width)
+                if offset < bar_width:
+                    label = f"{db_marker:d}dB" if db_marker == 0 else f"{db_marker:d}"
+                    markers.append((offset, label))
+            self._scale_cache = (bar_width, markers)
+        return self._scale_cache[1]
+    
+    def _frame_unchanged(self, *state):
+        """Return True if state matches the last drawn frame, otherwise remember it"""
+        if state == self._last_frame:
+            return True
+        self._last_frame = state
+        return False
+    
+    def _draw_bar(self, stdscr, row, col, bar_width, bar_length, peak_pos, max_pos, db, is_on):
+        """Draw one channel's level bar with its peak and max RMS indicators"""
+        # Use gray if source is off, otherwise color based on level
+        if not is_on:
+            color = self._attr_off
+        elif db < -20:
+            color = self._attr_green
+        elif db < -10:
+            color = self._attr_yellow
+        else:
+            color = self._attr_red
         
-        # Wait a moment for process to start
-        time.sleep(0.1)
+        # Draw bar up to current RMS level in one call
+        filled = min(bar_length, bar_width)
+        if filled > 0:
+            stdscr.addstr(row, col, '█' * filled, color)
         
-        # Check if process started successfully
-        if self.process.poll() is not None:
-            self.stop_recording()
-            stderr = self.process.stderr.read().decode('utf-8', errors='replace')
-            raise RuntimeError(f"pw-record failed to start: {stderr}")
+        # Draw peak indicator (>) at current peak position
+        if bar_length <= peak_pos < bar_width:
+            stdscr.addch(row, col + peak_pos, '>', self._attr_peak)
+        # Draw max RMS indicator
+        if bar_length <= max_pos < bar_width and max_pos != peak_pos:
+            stdscr.addch(row, col + max_pos, '│', self._attr_max)
+        
+    def draw_vu_meter(self, stdscr):
+        """Main curses loop to draw the VU meter"""
+        curses.curs_set(0)  # Hide cursor
+        stdscr.leaveok(True)  # Cursor is hidden, so never spend output moving it
+        # Non-blocking input: the blocking audio read already paces the loop
+        stdscr.nodelay(1)
+        
+        # Initialize colors
+        self._init_colors()
+        
+        self.start_recording()
         
         try:
+            self.wait_for_start()
+            
             while True:
                 # Check for 'q' or ESC key to quit
                 key = stdscr.getch()
@@ -183,30 +437,20 @@ class VUMeter:
                 if audio is None:
                     break
                     
-                # Clear screen
-                stdscr.clear()
-                
                 # Get terminal dimensions
                 height, width = stdscr.getmaxyx()
                 
                 # Calculate dB for each channel and update history
-                db_levels = []
-                peak_db_levels = []
-                max_db_levels = []
-                max_peak_db_levels = []
-                is_on_status = []
-                clip_status = []
-                for ch in range(self.channels):
-                    db = self.calculate_db(audio[:, ch])
-                    peak_db = self.calculate_peak_db(audio[:, ch])
-                    is_clipping = self.detect_clipping(audio[:, ch])
-                    max_db, max_peak_db, is_on, has_clipped = self.update_history(ch, db, peak_db, is_clipping)
-                    db_levels.append(db)
-                    peak_db_levels.append(peak_db)
-                    max_db_levels.append(max_db)
-                    max_peak_db_levels.append(max_peak_db)
-                    is_on_status.append(is_on)
-                    clip_status.append(has_clipped)
+                db_levels, peak_db_levels, clipping = self.calculate_levels(audio)
+                max_db_levels, max_peak_db_levels, is_on_status, clip_status = self.update_history_all(db_levels, peak_db_levels, clipping)
+                
+                # Nothing to redraw when no displayed value moved (e.g. silence)
+                if self._frame_unchanged(height, width, db_levels.tobytes(), max_db_levels.tobytes(),
+                                         max_peak_db_levels.tobytes(), is_on_status.tobytes(), clip_status.tobytes()):
+                    continue
+                
+                # Clear screen (erase() lets curses send only the cells that changed)
+                stdscr.erase()
                     
                 # Draw header
                 header = f"VU Meter - {self.target} | Press 'q' or ESC to quit"
@@ -221,22 +465,19 @@ class VUMeter:
                 right_label_width = 20  # Width for " Peak: -XX.X CLIP"
                 bar_width = width - left_label_width - right_label_width - 1
                 
+                # Bar cell positions for all channels (RMS, historical max peak, max RMS)
+                bar_lengths = self._bar_positions(db_levels, bar_width)
+                peak_positions = self._bar_positions(max_peak_db_levels, bar_width)
+                max_positions = self._bar_positions(max_db_levels, bar_width)
+                
                 for ch, (db, peak_db, max_db, max_peak_db, is_on, has_clipped) in enumerate(zip(db_levels, peak_db_levels, max_db_levels, max_peak_db_levels, is_on_status, clip_status)):
                     row = start_row + ch * 2
                     if row >= height - 1:
                         break
                         
-                    # Calculate bar length (from min_db to max_db) for RMS
-                    normalized = (db - self.min_db) / self.db_range  # 0.0 to 1.0
-                    bar_length = int(normalized * bar_width)
-                    
-                    # Calculate peak position for historical max peak
-                    peak_normalized = (max_peak_db - self.min_db) / self.db_range
-                    peak_pos = int(peak_normalized * bar_width)
-                    
-                    # Calculate max RMS position
-                    max_normalized = (max_db - self.min_db) / self.db_range
-                    max_pos = int(max_normalized * bar_width)
+                    bar_length = bar_lengths[ch]
+                    peak_pos = peak_positions[ch]
+                    max_pos = max_positions[ch]
                     
                     # Create labels with both RMS and peak
                     left_label = f" {db:5.1f}dB "
@@ -250,27 +491,7 @@ class VUMeter:
                         stdscr.addstr(row, 0, left_label)
                         
                         # Draw bar with color coding
-                        for i in range(bar_width):
-                            pos = left_label_width + i
-                            
-                            # Draw bar up to current RMS level
-                            if i < bar_length:
-                                # Use gray if source is off, otherwise color based on level
-                                if not is_on:
-                                    color = curses.color_pair(4) | curses.A_DIM  # Gray
-                                elif db < -20:
-                                    color = curses.color_pair(1)  # Green
-                                elif db < -10:
-                                    color = curses.color_pair(2)  # Yellow
-                                else:
-                                    color = curses.color_pair(3)  # Red
-                                stdscr.addch(row, pos, '█', color)
-                            # Draw peak indicator (>) at current peak position
-                            elif i == peak_pos and peak_pos >= bar_length:
-                                stdscr.addch(row, pos, '>', curses.color_pair(3) | curses.A_BOLD)
-                            # Draw max RMS indicator
-                            elif i == max_pos and max_pos >= bar_length and max_pos != peak_pos:
-                                stdscr.addch(row, pos, '│', curses.color_pair(2) | curses.A_BOLD)
+                        self._draw_bar(stdscr, row, left_label_width, bar_width, bar_length, peak_pos, max_pos, db, is_on)
                         
                         # Draw right label (max dB)
                         stdscr.addstr(row, left_label_width + bar_width, right_label[:right_label_width])
@@ -280,27 +501,21 @@ class VUMeter:
                             scale_row = row + 1
                             
                             # Draw markers every 10dB
-                            for db_marker in range(int(self.min_db), int(self.max_db) + 1, 10):
-                                if db_marker < self.min_db or db_marker > self.max_db:
-                                    continue
-                                    
-                                marker_normalized = (db_marker - self.min_db) / self.db_range
-                                marker_pos = left_label_width + int(marker_normalized * bar_width)
-                                
-                                if marker_pos < left_label_width + bar_width:
-                                    try:
-                                        stdscr.addstr(scale_row, marker_pos, "│", curses.A_DIM)
-                                        # Add label for start, middle-ish, and end markers
-                                        label = f"{db_marker:d}dB" if db_marker == 0 else f"{db_marker:d}"
-                                        label_pos = marker_pos - len(label) // 2
-                                        if label_pos >= 0 and label_pos + len(label) < width:
-                                            stdscr.addstr(scale_row + 1, label_pos, label, curses.A_DIM)
-                                    except:
-                                        pass
+                            for offset, label in self._scale_markers(bar_width):
+                                marker_pos = left_label_width + offset
+                                try:
+                                    stdscr.addstr(scale_row, marker_pos, "│", curses.A_DIM)
+                                    # Add label for start, middle-ish, and end markers
+                                    label_pos = marker_pos - len(label) // 2
+                                    if label_pos >= 0 and label_pos + len(label) < width:
+                                        stdscr.addstr(scale_row + 1, label_pos, label, curses.A_DIM)
+                                except:
+                                    pass
                     except:
                         pass
                         
-                stdscr.refresh()
+                stdscr.noutrefresh()
+                curses.doupdate()
                 
         finally:
             self.stop_recording()
@@ -320,7 +535,7 @@ def main():
     parser.add_argument('--channels', type=int, default=2,
                         help='Number of channels (default: 2)')
     parser.add_argument('--format', default='s32',
-                        help='Sample format: s16, s32 (default: s32)')
+                        help='Sample format: s16, s24, s32 (default: s32)')
     parser.add_argument('--interval', type=float, default=0.2,
                         help='Update interval in seconds (default: 0.2)')
     parser.add_argument('--db-range', type=int, default=90,